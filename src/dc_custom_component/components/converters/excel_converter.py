@@ -1,14 +1,39 @@
+import csv
 import io
+import itertools
+from datetime import datetime, time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple, Literal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, Tuple, Literal
 
+import numpy as np
+import openpyxl
 import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
 from haystack import Document, logging, component
 from haystack.dataclasses import ByteStream
 from haystack.components.converters.utils import get_bytestream_from_source, normalize_metadata
 
 logger = logging.getLogger(__name__)
 
+# Values that pd.read_excel reads as missing: Excel error cells and the pandas default NA strings
+_MISSING_VALUES = frozenset(ERROR_CODES) | frozenset(
+    {
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+        "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    }
+)
+
+
+def _normalize_cell(value: Any) -> Any:
+    """
+    Convert a cell value the way pd.read_excel does, returning None for missing values.
+    """
+    if value in _MISSING_VALUES:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
 
 @component
 class PandasExcelToDocument:
@@ -58,70 +83,145 @@ class PandasExcelToDocument:
             except Exception as e:
                 logger.warning("Could not read {source}. Skipping it. Error: {error}", source=source, error=e)
                 continue
+            # Sheets are converted one at a time, so only one sheet's rows are held in memory
+            source_documents = []
             try:
-                tables, tables_metadata = self._extract_tables(bytestream)
+                for table, excel_metadata in self._extract_tables(bytestream):
+                    merged_metadata = {
+                        **bytestream.meta,
+                        **metadata,
+                        **excel_metadata
+                    }
+                    source_documents.append(Document(content=table, meta=merged_metadata))
             except Exception as e:
                 logger.warning(
-                    "Could not read {source} and convert it to a pandas dataframe, skipping. Error: {error}",
+                    "Could not read {source} and convert it to a table, skipping. Error: {error}",
                     source=source,
                     error=e,
                 )
                 continue
-
-            # Loop over tables and create a Document for each table
-            for table, excel_metadata in zip(tables, tables_metadata):
-                merged_metadata = {
-                    **bytestream.meta,
-                    **metadata,
-                    **excel_metadata
-                }
-                document = Document(content=table, meta=merged_metadata)
-                documents.append(document)
+            documents.extend(source_documents)
 
         return {"documents": documents}
 
-    def _extract_tables(self, bytestream: ByteStream) -> Tuple[List[str], List[Dict]]:
+    def _extract_tables(self, bytestream: ByteStream) -> Iterator[Tuple[str, Dict]]:
         """
-        Extract tables from a Excel file.
+        Extract tables from a Excel file, yielding one table and its metadata per sheet.
         """
-        df_dict = pd.read_excel(
-            io=io.BytesIO(bytestream.data),
-            header=None,  # Don't assign any pandas column labels
-            sheet_name=None,  # Loads all sheets
-            engine="openpyxl",  # Use openpyxl as the engine to read the Excel file
+        # Read-only mode streams the sheet XML instead of building the full cell object model in memory.
+        # Links to external workbooks are never read, so skip parsing them.
+        workbook = openpyxl.load_workbook(
+            io.BytesIO(bytestream.data), read_only=True, data_only=True, keep_links=False
         )
-
-        # Drop all columns and rows that are completely empty
-        for key in df_dict:
-            df = df_dict[key]
-            df = df.dropna(axis=1, how="all", ignore_index=True)
-            df = df.dropna(axis=0, how="all", ignore_index=True)
-            df_dict[key] = df
-
-        tables = []
-        metadata = []
-        for key in df_dict:
-            if self.table_format == "csv":
-                resolved_kwargs = {
-                    "index": False,
-                    "header": False,
-                    **self.table_format_kwargs,
-                }
-                tables.append(
-                    df_dict[key].to_csv(**resolved_kwargs)
-                )
-            elif self.table_format == "markdown":
-                resolved_kwargs = {
-                    "index": False,
-                    "headers": (),
-                    "tablefmt": "pipe",  # tablefmt 'plain', 'simple', 'grid', 'pipe', 'orgtbl', 'rst', 'mediawiki',
-                                         # 'latex', 'latex_raw', 'latex_booktabs', 'latex_longtable' and tsv
-                    **self.table_format_kwargs,
-                }
-                tables.append(
-                    df_dict[key].to_markdown(**resolved_kwargs)
+        try:
+            for worksheet in workbook.worksheets:
+                # The dimensions stored in the file can be wrong, so let openpyxl scan the actual rows
+                worksheet.reset_dimensions()
+                direct_csv = self.table_format == "csv" and not self.table_format_kwargs
+                rows = self._drop_empty_rows_and_columns(
+                    worksheet.iter_rows(values_only=True), format_dates=direct_csv
                 )
-            else:
-                raise ValueError(f"Unsupported export format: {self.table_format}. Choose either 'csv' or 'markdown'.")
-            metadata.append({"sheet_name": key})
-        return tables, metadata
+                if direct_csv:
+                    # Without custom pandas kwargs the rows can be written straight to CSV
+                    table = self._rows_to_csv(rows)
+                else:
+                    table = self._dataframe_to_table(self._rows_to_dataframe(rows))
+                yield table, {"sheet_name": worksheet.title}
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _drop_empty_rows_and_columns(
+        rows: Iterable[Tuple[Any, ...]], format_dates: bool = False
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Drop all columns and rows that are completely empty in a single pass over the cells.
+
+        :param rows: The rows of cell values of a sheet.
+        :param format_dates: Convert columns that only hold datetimes at midnight to dates, as `to_csv` writes them.
+        """
+        kept_rows = []
+        col_nonempty = bytearray()
+        # Columns where every value seen so far is a datetime at midnight
+        col_dates = bytearray()
+        for row in rows:
+            row = tuple(map(_normalize_cell, row))
+            if len(row) > len(col_nonempty):
+                col_nonempty.extend(bytes(len(row) - len(col_nonempty)))
+                col_dates.extend(b"\x01" * (len(row) - len(col_dates)))
+            row_nonempty = False
+            for col, value in enumerate(row):
+                if value is None:
+                    continue
+                row_nonempty = True
+                col_nonempty[col] = 1
+                if col_dates[col] and not (isinstance(value, datetime) and value.time() == time()):
+                    col_dates[col] = 0
+            if row_nonempty:
+                kept_rows.append(row)
+
+        n_cols = len(col_nonempty)
+        date_cols = [col for col in range(n_cols) if col_nonempty[col] and col_dates[col]] if format_dates else []
+        # Project the rows in place, so only one copy of the sheet is held at a time
+        for i, row in enumerate(kept_rows):
+            # Rows from a read-only sheet end at their last cell, so pad them to the full width
+            padded_row = list(row) + [None] * (n_cols - len(row))
+            for col in date_cols:
+                if padded_row[col] is not None:
+                    padded_row[col] = padded_row[col].date()
+            kept_rows[i] = tuple(itertools.compress(padded_row, col_nonempty))
+        return kept_rows
+
+    @staticmethod
+    def _rows_to_csv(rows: List[Tuple[Any, ...]]) -> str:
+        """
+        Write rows to a CSV string.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _rows_to_dataframe(rows: List[Tuple[Any, ...]]) -> pd.DataFrame:
+        """
+        Build a DataFrame of the cell values from rows of equal length.
+
+        The rows are removed from `rows` as they are copied, so the sheet isn't held twice.
+        """
+        cells = np.empty((len(rows), len(rows[0]) if rows else 0), dtype=object)
+        for i in range(len(rows) - 1, -1, -1):
+            cells[i] = rows.pop()
+        # Without an explicit dtype pandas still infers column types, e.g. turning None into NaN in text columns
+        return pd.DataFrame(cells, dtype=object, copy=False)
+
+    def _dataframe_to_table(self, df: pd.DataFrame) -> str:
+        """
+        Convert a DataFrame to a table in the configured format.
+        """
+        if self.table_format == "csv":
+            # Parse datetime columns like read_excel did, so to_csv writes them as dates when they have no time part
+            for col in df.columns:
+                if pd.api.types.infer_dtype(df[col], skipna=True) == "datetime":
+                    df[col] = pd.to_datetime(df[col])
+            resolved_kwargs = {
+                "index": False,
+                "header": False,
+                "lineterminator": "\n",  # Same line endings as the direct CSV path, regardless of the OS
+                **self.table_format_kwargs,
+            }
+            csv_table: str = df.to_csv(**resolved_kwargs)
+            return csv_table
+        elif self.table_format == "markdown":
+            resolved_kwargs = {
+                "index": False,
+                "headers": (),
+                "tablefmt": "pipe",  # tablefmt 'plain', 'simple', 'grid', 'pipe', 'orgtbl', 'rst', 'mediawiki',
+                                     # 'latex', 'latex_raw', 'latex_booktabs', 'latex_longtable' and tsv
+                "missingval": "nan",  # Render empty cells like the NaN values read_excel produced
+                **self.table_format_kwargs,
+            }
+            markdown_table: str = df.to_markdown(**resolved_kwargs)
+            return markdown_table
+        else:
+            raise ValueError(f"Unsupported export format: {self.table_format}. Choose either 'csv' or 'markdown'.")
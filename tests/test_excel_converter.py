@@ -0,0 +1,177 @@
+import io
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import openpyxl
+import pytest
+from haystack.dataclasses import ByteStream
+
+from dc_custom_component.components.converters.excel_converter import PandasExcelToDocument
+
+
+def _workbook_bytestream(
+    sheets: List[Tuple[str, Dict[str, Any]]], meta: Optional[Dict[str, Any]] = None
+) -> ByteStream:
+    """
+    Build an in-memory workbook from (sheet_name, {cell: value}) pairs.
+    """
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name, cells in sheets:
+        worksheet = workbook.create_sheet(sheet_name)
+        for coordinate, value in cells.items():
+            worksheet[coordinate] = value
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return ByteStream(data=buffer.getvalue(), meta=meta or {})
+
+
+class TestPandasExcelToDocument:
+    def test_run_treats_na_strings_and_errors_as_empty(self) -> None:
+        source = _workbook_bytestream(
+            [("Sheet", {"A1": "NULL", "B1": "nan", "C1": "#DIV/0!", "A2": "x", "B2": 2.0, "C2": "N/A"})]
+        )
+
+        documents = PandasExcelToDocument().run(sources=[source])["documents"]
+
+        assert documents[0].content == "x,2\n"
+
+    def test_run_keeps_integers_in_float_columns(self) -> None:
+        # read_excel wrote 3.0 and 1.0 here because the columns were parsed as float64
+        source = _workbook_bytestream([("Sheet", {"A1": 2.5, "A2": 3, "B1": 1, "C2": "x"})])
+
+        for table_kwargs in (None, {"sep": ","}):
+            converter = PandasExcelToDocument(table_format_kwargs=table_kwargs)
+            documents = converter.run(sources=[source])["documents"]
+
+            assert documents[0].content == "2.5,1,\n3,,x\n"
+
+    def test_run_writes_booleans_as_true_false(self) -> None:
+        # read_excel wrote 1/0 in markdown for all-boolean columns and 1.0/0.0 in CSV for boolean columns with gaps
+        source = _workbook_bytestream([("Sheet", {"A1": True, "A3": False, "B1": 1, "B2": 2, "B3": 3})])
+
+        csv_documents = PandasExcelToDocument().run(sources=[source])["documents"]
+        markdown_source = _workbook_bytestream([("Sheet", {"A1": True, "A2": False})])
+        markdown_documents = PandasExcelToDocument(table_format="markdown").run(sources=[markdown_source])["documents"]
+
+        assert csv_documents[0].content == "True,1\n,2\nFalse,3\n"
+        assert markdown_documents[0].content == "|:------|\n| True  |\n| False |"
+
+    def test_run_empty_sheet(self) -> None:
+        source = _workbook_bytestream([("Empty", {})])
+
+        for table_format in ("csv", "markdown"):
+            documents = PandasExcelToDocument(table_format=table_format).run(sources=[source])["documents"]
+
+            assert len(documents) == 1
+            assert documents[0].content == ""
+            assert documents[0].meta["sheet_name"] == "Empty"
+
+    def test_run_pads_jagged_rows(self) -> None:
+        # Read-only rows end at their last cell, so row 1 is shorter than row 2 and needs padding
+        source = _workbook_bytestream([("Sheet", {"A1": "a", "C2": "c"})])
+
+        documents = PandasExcelToDocument().run(sources=[source])["documents"]
+
+        assert documents[0].content == "a,\n,c\n"
+
+    def test_run_drops_empty_rows_and_columns(self) -> None:
+        source = _workbook_bytestream(
+            [("Sheet", {"B2": "name", "D2": "qty", "B3": "", "D3": None, "B4": "apple", "D4": 3, "C5": ""})]
+        )
+
+        documents = PandasExcelToDocument().run(sources=[source])["documents"]
+
+        assert documents[0].content == "name,qty\napple,3\n"
+
+    def test_run_csv_matches_to_csv_path(self) -> None:
+        source = _workbook_bytestream(
+            [
+                (
+                    "Sheet",
+                    {
+                        "A1": 1, "B1": 'say "hi", then', "C1": datetime(2024, 1, 1),
+                        "D1": datetime(2024, 1, 1, 10, 30),
+                        "A3": 2.5, "B3": True, "C3": date(2024, 3, 4), "D3": datetime(2024, 1, 2), "E3": "NA",
+                        "C4": "end",
+                    },
+                )
+            ]
+        )
+
+        direct = PandasExcelToDocument().run(sources=[source])["documents"]
+        via_pandas = PandasExcelToDocument(table_format_kwargs={"sep": ","}).run(sources=[source])["documents"]
+
+        assert direct[0].content == via_pandas[0].content == (
+            '1,"say ""hi"", then",2024-01-01 00:00:00,2024-01-01 10:30:00\n'
+            "2.5,True,2024-03-04 00:00:00,2024-01-02 00:00:00\n"
+            ",,end,\n"
+        )
+
+    def test_run_csv_writes_dates_without_time(self) -> None:
+        source = _workbook_bytestream([("Sheet", {"A1": datetime(2024, 1, 1), "A2": date(2024, 3, 4), "B1": "x"})])
+
+        for table_kwargs in (None, {"sep": ","}):
+            converter = PandasExcelToDocument(table_format_kwargs=table_kwargs)
+            documents = converter.run(sources=[source])["documents"]
+
+            assert documents[0].content == "2024-01-01,x\n2024-03-04,\n"
+
+    def test_run_multiple_sheets(self) -> None:
+        source = _workbook_bytestream(
+            [("First", {"A1": 1}), ("Second", {"A1": 2}), ("Third", {"A1": 3})], meta={"file_name": "book.xlsx"}
+        )
+
+        documents = PandasExcelToDocument().run(sources=[source], meta={"team": "sales"})["documents"]
+
+        assert [doc.meta["sheet_name"] for doc in documents] == ["First", "Second", "Third"]
+        assert [doc.content for doc in documents] == ["1\n", "2\n", "3\n"]
+        assert all(doc.meta["file_name"] == "book.xlsx" and doc.meta["team"] == "sales" for doc in documents)
+
+    def test_run_skips_source_that_fails_part_way(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        failing = _workbook_bytestream([("First", {"A1": "ok"}), ("Second", {"A1": "boom"})])
+        working = _workbook_bytestream([("Only", {"A1": "fine"})])
+        rows_to_csv = PandasExcelToDocument._rows_to_csv
+
+        def _fail_on_boom(rows: List[Tuple[Any, ...]]) -> str:
+            if rows == [("boom",)]:
+                raise ValueError("broken sheet")
+            return rows_to_csv(rows)
+
+        monkeypatch.setattr(PandasExcelToDocument, "_rows_to_csv", staticmethod(_fail_on_boom))
+
+        documents = PandasExcelToDocument().run(sources=[failing, working])["documents"]
+
+        assert [doc.content for doc in documents] == ["fine\n"]
+
+    def test_run_unsupported_format_skips_source(self) -> None:
+        source = _workbook_bytestream([("Sheet", {"A1": 1})])
+
+        documents = PandasExcelToDocument(table_format="html").run(sources=[source])["documents"]  # type: ignore
+
+        assert documents == []
+
+    def test_run_markdown(self) -> None:
+        source = _workbook_bytestream([("Sheet", {"A1": "name", "B1": "qty", "A2": "apple", "B2": 3})])
+
+        documents = PandasExcelToDocument(table_format="markdown").run(sources=[source])["documents"]
+
+        assert documents[0].content == "|:------|:----|\n| name  | qty |\n| apple | 3   |"
+
+    def test_run_markdown_renders_gaps_consistently(self) -> None:
+        source = _workbook_bytestream([("Sheet", {"A1": 1, "C1": "t", "B2": "x", "C2": "u"})])
+
+        documents = PandasExcelToDocument(table_format="markdown").run(sources=[source])["documents"]
+
+        assert documents[0].content == "|----:|:----|:--|\n|   1 | nan | t |\n| nan | x   | u |"
+
+    def test_run_csv_kwargs_use_lf_line_endings(self) -> None:
+        source = _workbook_bytestream([("Sheet", {"A1": "a", "B1": 1, "A2": "b", "B2": 2})])
+
+        documents = PandasExcelToDocument(table_format_kwargs={"sep": ";"}).run(sources=[source])["documents"]
+        crlf_documents = PandasExcelToDocument(
+            table_format_kwargs={"sep": ";", "lineterminator": "\r\n"}
+        ).run(sources=[source])["documents"]
+
+        assert documents[0].content == "a;1\nb;2\n"
+        assert crlf_documents[0].content == "a;1\r\nb;2\r\n"